@@ -4,15 +4,25 @@
 import serial
 import serial.tools.list_ports
 import argparse
+import glob
+import os
+import platform
+import re
+import select
 import sys
+import struct
+import threading
 import time
 from typing import Optional, List, Tuple
-from collections import deque
-from rich.console import Console
+from array import array
+from functools import lru_cache
+from itertools import chain, repeat
+from rich.console import Console, RenderableType
 from rich.layout import Layout
 from rich.live import Live
+from rich.markup import escape
 from rich.panel import Panel
-from rich.text import Text
+from rich.text import Span, Text
 from rich.align import Align
 from rich.table import Table
 
@@ -31,14 +41,124 @@ PACKET_V2_SIZE = 10
 HISTORY_SIZE = 60
 DEFAULT_BAUD = 9600
 DEFAULT_TIMEOUT = 0.5
+REFRESH_INTERVAL = 0.25
+COMPACT_REFRESH_INTERVAL = 0.5
+RX_BUFFER_SIZE = 65536
+RX_CHUNK_SIZE = 4096
+RX_TAIL_TIMEOUT = 0.1  # a whole v2 packet takes ~10 ms at 9600 baud
+READ_POLL_INTERVAL = 0.1
+
+# v2 body after header + flags: stack, peak, heap, free (big-endian words)
+_V2_BODY = struct.Struct('>HHHH')
+# v1 body after header: stack (big-endian word)
+_V1_BODY = struct.Struct('>H')
+
+# Port descriptions that look like an Arduino / USB-serial adapter
+_ARDUINO_RE = re.compile(r'Arduino|CH340|USB', re.IGNORECASE)
+
+# Every possible bar, indexed by filled cells (and marker cell for the peak marker)
+BAR_WIDTH = 20
+_BAR_LUT = tuple('█' * i + '░' * (BAR_WIDTH - i) for i in range(BAR_WIDTH + 1))
+_BAR_MARKER_LUT = tuple(
+    tuple(bar[:m] + '▌' + bar[m + 1:] for m in range(BAR_WIDTH)) + (bar,)
+    for bar in _BAR_LUT
+)
+
+BAR_ROWS = ("Static Data", "Stack Usage", "Peak Stack", "Heap Usage", "Free Memory", "Total Used")
+
+
+def find_packet(buf: bytearray, pos: int, flush: bool = False) -> Tuple[int, int]:
+    """Locate the next complete packet in buf at or after pos.
+
+    Returns (start, size) with size PACKET_V2_SIZE or PACKET_V1_SIZE, or
+    (resume_pos, 0) when no complete packet is buffered yet. A header with
+    fewer than PACKET_V2_SIZE bytes behind it is only taken as v1 when the
+    data says so; otherwise it waits for more bytes, unless flush is set
+    (the tail has stopped growing), in which case it is decoded as v1.
+    """
+    end = len(buf)
+    while end - pos >= PACKET_V1_SIZE:
+        if buf[pos] != HEADER_BYTE:
+            pos = buf.find(HEADER_BYTE, pos + 1)
+            if pos < 0:
+                return end, 0
+            continue
+        
+        # v2 flags never use the high nibble
+        if buf[pos + 1] >= 0x10:
+            return pos, PACKET_V1_SIZE
+        
+        # Two more v1 headers right behind this one. A v2 packet can't look like
+        # this: pos + 6 is its heap high byte, which is below 0x10.
+        if (end - pos >= 2 * PACKET_V1_SIZE + 1 and buf[pos + PACKET_V1_SIZE] == HEADER_BYTE
+                and buf[pos + 2 * PACKET_V1_SIZE] == HEADER_BYTE):
+            return pos, PACKET_V1_SIZE
+        
+        if end - pos >= PACKET_V2_SIZE:
+            return pos, PACKET_V2_SIZE
+        if flush:
+            return pos, PACKET_V1_SIZE
+        return pos, 0
+    
+    return pos, 0
+
+
+def format_pct(value: int) -> str:
+    """value as a percentage of TOTAL_SRAM, exactly like f"{pct:4.1f}" but in integer math."""
+    tenths, rem = divmod(abs(value) * 1000, TOTAL_SRAM)
+    # Round half to even, as float formatting does for these exact binary fractions
+    tenths += 2 * rem > TOTAL_SRAM or (2 * rem == TOTAL_SRAM and tenths & 1)
+    return f"{'-' if value < 0 else ''}{tenths // 10}.{tenths % 10}".rjust(4)
+
+
+@lru_cache(maxsize=None)
+def sparkline_lut(max_val: int) -> str:
+    """Block character for every sample value 0..max_val, indexed by value."""
+    blocks = " ▁▂▃▄▅▆▇█"
+    return ''.join(blocks[val * 8 // max_val] for val in range(max_val + 1))
+
+
+def _fast_scan_ports() -> List[str]:
+    """List likely USB serial devices by name only, without probing each port like comports()."""
+    if sys.platform.startswith('win'):
+        import winreg
+        ports = []
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DEVICEMAP\SERIALCOMM") as key:
+                for i in range(winreg.QueryInfoKey(key)[1]):
+                    ports.append(winreg.EnumValue(key, i)[1])
+        except OSError:
+            pass
+        return ports
+    
+    patterns = ('/dev/ttyACM*', '/dev/ttyUSB*', '/dev/cu.usbmodem*', '/dev/cu.usbserial*')
+    return sorted(port for pattern in patterns for port in glob.glob(pattern))
 
 
 class StackScopeVisualizer:
+    # --compact view: the whole dashboard as one markup string, parsed once per refresh
+    _COMPACT_TPL = (
+        "[bold cyan]StackScope v2.0[/] [dim]│ Port: {port} │[/] [dim green]Packets: {packets}[/]{live}\n"
+        "\n"
+        "[blue]Static Data[/]  {static:4d}B ({static_pct}%)  [blue]{static_bar}[/]\n"
+        "[{stack_style}]Stack Usage[/]  {stack:4d}B ({stack_pct}%)  [{stack_style}]{stack_bar}[/]\n"
+        "[{peak_style}]Peak Stack[/]   {peak:4d}B ({peak_pct}%)  [red]{peak_bar}[/]\n"
+        "[{heap_style}]Heap Usage[/]   {heap:4d}B ({heap_pct}%)  [{heap_style}]{heap_bar}[/]\n"
+        "[{free_style}]Free Memory[/]  {free:4d}B ({free_pct}%)  [{free_style}]{free_bar}[/]\n"
+        "[white]Total Used[/]   {used:4d}B ({used_pct}%)  [white]{used_bar}[/]\n"
+        "\n"
+        "[yellow]Stack[/] {stack_spark}  [magenta]Heap[/] {heap_spark}\n"
+        "[dim]Runtime: {runtime:.0f}s │ Update: {rate:.1f}Hz[/]\n"
+        "\n"
+        "[{status_style}]{status}[/]"
+    )
+    
     def __init__(self, port: Optional[str] = None, baud: int = DEFAULT_BAUD, 
-                 static_data: int = 0):
+                 static_data: int = 0, compact: bool = False):
         self.port = port
         self.baud = baud
         self.static_data = static_data
+        self.compact = compact
         self.serial_conn: Optional[serial.Serial] = None
         self.console = Console()
         
@@ -49,24 +169,49 @@ class StackScopeVisualizer:
         self.flags = 0
         
         self.packet_count = 0
-        self.last_update = time.time()
-        self.start_time = time.time()
-        
-        self.stack_history: deque = deque(maxlen=HISTORY_SIZE)
-        self.heap_history: deque = deque(maxlen=HISTORY_SIZE)
+        self._rx_buf = bytearray()
+        self._rx_pos = 0
+        self._rx_last_data = 0.0
+        
+        # Filled by the reader thread, drained by the UI loop
+        self._rx_pending = bytearray()
+        self._rx_lock = threading.Lock()
+        self._rx_event = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._reader_stop = threading.Event()
+        self._reader_error: Optional[Exception] = None
+        # Monotonic clock, sampled once per UI loop pass
+        self._now = time.monotonic()
+        self.last_update = self._now
+        self.start_time = self._now
+        
+        # Preallocated ring buffers sharing one write cursor (total samples written)
+        self.stack_history = array('H', [0]) * HISTORY_SIZE
+        self.heap_history = array('H', [0]) * HISTORY_SIZE
+        self._hist_pos = 0
         
         self.collision_detected = False
         self.alert_active = False
         self.peak_flash = False
         
+        self._dirty = True
+        self._shown_clock: Tuple[bool, int] = (False, 0)
+        self._build_dashboard()
+        
     def find_serial_port(self) -> Optional[str]:
+        # A lone USB serial device is almost certainly the board; skip the full probe
+        candidates = _fast_scan_ports()
+        if len(candidates) == 1:
+            return candidates[0]
+        
         ports = serial.tools.list_ports.comports()
         if not ports:
             self.console.print("[red]No serial ports found![/red]")
             return None
         
         # Look for Arduino-like devices
-        arduino_ports = [p for p in ports if 'Arduino' in p.description or 'CH340' in p.description or 'USB' in p.description]
+        arduino_ports = [p for p in ports if p.description and _ARDUINO_RE.search(p.description)]
         
         if len(arduino_ports) == 1:
             return arduino_ports[0].device
@@ -103,135 +248,213 @@ class StackScopeVisualizer:
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE
             )
+            self.enable_low_latency()
+            try:
+                self._fd = self.serial_conn.fileno()
+            except (AttributeError, OSError):
+                self._fd = None  # e.g. Windows: keep using pyserial's read()
             
             time.sleep(2.0)  # wait for Arduino reset
             self.serial_conn.reset_input_buffer()
-            for _ in range(3):
-                self.serial_conn.write(bytes([HANDSHAKE_BYTE]))
-                time.sleep(0.1)
+            # Repeated in case the first byte is lost; the firmware treats each one alike
+            self.serial_conn.write(bytes([HANDSHAKE_BYTE]) * 3)
+            self.serial_conn.flush()
+            
+            self._reader_stop.clear()
+            self._reader_error = None
+            self._reader = threading.Thread(target=self._reader_loop, name="stackscope-reader", daemon=True)
+            self._reader.start()
             
             self.console.print(f"[green]Connected to {self.port}[/green]")
             self.console.print("[cyan]Handshake sent - waiting for data...[/cyan]")
-            self.start_time = time.time()
+            self._now = time.monotonic()
+            self.start_time = self._now
+            self._build_header_prefix()
             return True
             
         except serial.SerialException as e:
             self.console.print(f"[red]Failed to connect: {e}[/red]")
             return False
     
+    def enable_low_latency(self):
+        # USB-serial adapters (FTDI) batch bytes for up to 16 ms by default;
+        # ASYNC_LOW_LATENCY drops that to ~1 ms. Best effort, Linux only.
+        if platform.system() != 'Linux':
+            return
+        try:
+            self.serial_conn.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError):
+            pass
+    
     def disconnect(self):
+        self._reader_stop.set()
         if self.serial_conn and self.serial_conn.is_open:
+            if hasattr(self.serial_conn, 'cancel_read'):
+                self.serial_conn.cancel_read()
+            if self._reader:
+                self._reader.join(DEFAULT_TIMEOUT)
             self.serial_conn.close()
     
-    def read_word(self) -> int:
-        data = self.serial_conn.read(2)
-        if len(data) == 2:
-            return (data[0] << 8) | data[1]
-        return 0
+    def _read_bulk(self) -> bytes:
+        """Next chunk from the port, or b'' if nothing arrived within the poll interval."""
+        if self._fd is None:
+            return self.serial_conn.read(self.serial_conn.in_waiting or 1)
+        
+        # Straight to the fd, skipping pyserial's per-call overhead. pyserial
+        # opens POSIX ports O_NONBLOCK, so wait for readability first.
+        if not select.select([self._fd], [], [], READ_POLL_INTERVAL)[0]:
+            return b''
+        try:
+            data = os.read(self._fd, RX_CHUNK_SIZE)
+        except BlockingIOError:
+            return b''
+        if not data:
+            # Unplugged devices stay readable but return nothing; _reader_loop
+            # hands this to run(), which reports it and exits
+            raise serial.SerialException(f"{self.port} is readable but returned no data (unplugged?)")
+        return data
     
-    def read_packet(self) -> bool:
-        if not self.serial_conn or not self.serial_conn.is_open:
-            return False
-        
-        while self.serial_conn.in_waiting >= PACKET_V1_SIZE:
-            byte = self.serial_conn.read(1)
-            if not byte or byte[0] != HEADER_BYTE:
+    def _reader_loop(self):
+        while not self._reader_stop.is_set():
+            try:
+                data = self._read_bulk()
+            except (serial.SerialException, OSError, TypeError) as e:
+                # Port lost underneath us; unless we are shutting down, hand the
+                # error to the UI loop and wake it so it can report it
+                if not self._reader_stop.is_set():
+                    self._reader_error = e
+                    self._rx_event.set()
+                break
+            if not data:
                 continue
             
-            next_byte = self.serial_conn.read(1)
-            if not next_byte:
-                continue
-            
-            flags_or_high = next_byte[0]
-            
-            # v2 packet?
-            if self.serial_conn.in_waiting >= (PACKET_V2_SIZE - 2) and flags_or_high < 0x10:
-                self.flags = flags_or_high
-                self.stack_usage = self.read_word()
-                self.peak_usage = self.read_word()
-                self.heap_usage = self.read_word()
-                self.free_memory = self.read_word()
-            else:
-                # v1 fallback
-                low_byte = self.serial_conn.read(1)
-                if low_byte:
-                    self.stack_usage = (flags_or_high << 8) | low_byte[0]
-                    self.peak_usage = max(self.peak_usage, self.stack_usage)
-                    self.free_memory = TOTAL_SRAM - self.static_data - self.stack_usage
-                    self.flags = 0
-                    self.heap_usage = 0
-            
-            self.alert_active = bool(self.flags & FLAG_ALERT)
-            self.collision_detected = bool(self.flags & FLAG_COLLISION)
-            self.peak_flash = bool(self.flags & FLAG_PEAK_NEW)
-            self.stack_history.append(self.stack_usage)
-            self.heap_history.append(self.heap_usage)
-            
-            self.packet_count += 1
-            self.last_update = time.time()
-            return True
+            with self._rx_lock:
+                self._rx_pending += data
+                # Behave like a ring buffer: on overflow the oldest bytes go
+                overflow = len(self._rx_pending) - RX_BUFFER_SIZE
+                if overflow > 0:
+                    del self._rx_pending[:overflow]
+                pending = len(self._rx_pending)
+            # Wake the UI loop once a whole packet's worth is waiting, not per byte;
+            # smaller leftovers are picked up by its regular poll
+            if pending >= PACKET_V2_SIZE:
+                self._rx_event.set()
+    
+    def drain_input(self) -> int:
+        """Parse everything the reader thread has received so far. Returns packets parsed."""
+        with self._rx_lock:
+            if self._rx_pending:
+                self._rx_buf += self._rx_pending
+                self._rx_pending.clear()
+                self._rx_last_data = self._now
+        
+        count = 0
+        while self.read_packet():
+            count += 1
+        
+        # The reader hands bytes over as they arrive, so a short tail is usually
+        # the front of a v2 packet. Only once it has stopped growing is it
+        # decoded as whatever fits (v1).
+        if (len(self._rx_buf) - self._rx_pos >= PACKET_V1_SIZE
+                and self._now - self._rx_last_data >= RX_TAIL_TIMEOUT):
+            while self.read_packet(flush=True):
+                count += 1
+        
+        # Keep only the unparsed tail (a partial packet, if any)
+        del self._rx_buf[:self._rx_pos]
+        self._rx_pos = 0
+        return count
+    
+    def _handle_v2(self, buf: bytearray, pos: int):
+        self.flags = buf[pos + 1]
+        (self.stack_usage, self.peak_usage,
+         self.heap_usage, self.free_memory) = _V2_BODY.unpack_from(buf, pos + 2)
+    
+    def _handle_v1(self, buf: bytearray, pos: int):
+        stack, = _V1_BODY.unpack_from(buf, pos + 1)
+        self.stack_usage = stack
+        if stack > self.peak_usage:
+            self.peak_usage = stack
+        self.free_memory = TOTAL_SRAM - self.static_data - stack
+        self.flags = 0
+        self.heap_usage = 0
+    
+    # Keyed by the packet size find_packet() settled on. That size comes from
+    # the bytes themselves (or a stalled tail), not from how reads were chunked.
+    _PACKET_HANDLERS = {PACKET_V2_SIZE: _handle_v2, PACKET_V1_SIZE: _handle_v1}
+    
+    def read_packet(self, flush: bool = False) -> bool:
+        buf = self._rx_buf
+        pos, size = find_packet(buf, self._rx_pos, flush)
+        if not size:
+            self._rx_pos = pos
+            return False
         
-        return False
+        self._PACKET_HANDLERS[size](self, buf, pos)
+        self._rx_pos = pos + size
+        
+        self.alert_active = bool(self.flags & FLAG_ALERT)
+        self.collision_detected = bool(self.flags & FLAG_COLLISION)
+        self.peak_flash = bool(self.flags & FLAG_PEAK_NEW)
+        slot = self._hist_pos % HISTORY_SIZE
+        self.stack_history[slot] = self.stack_usage
+        self.heap_history[slot] = self.heap_usage
+        self._hist_pos += 1
+        
+        self.packet_count += 1
+        self.last_update = self._now
+        self._dirty = True
+        return True
     
-    def make_bar(self, value: int, max_val: int, width: int, color: str, 
+    def make_bar(self, value: int, max_val: int,
                  show_marker: bool = False, marker_pos: int = 0) -> str:
-        if max_val == 0:
-            pct = 0
-        else:
-            pct = min(value / max_val, 1.0)
+        if max_val <= 0:
+            return _BAR_LUT[0]
         
-        filled = int(pct * width)
-        bar = '█' * filled + '░' * (width - filled)
+        filled = min(max(value, 0) * BAR_WIDTH // max_val, BAR_WIDTH)
         
-        # Add peak marker if requested
+        # Add peak marker if requested (index BAR_WIDTH means off the end: no marker)
         if show_marker and marker_pos > 0:
-            marker_idx = int(min(marker_pos / max_val, 1.0) * width)
-            if marker_idx < width:
-                bar = bar[:marker_idx] + '▌' + bar[marker_idx+1:]
+            return _BAR_MARKER_LUT[filled][min(marker_pos * BAR_WIDTH // max_val, BAR_WIDTH)]
         
-        return f"[{color}]{bar}[/{color}]"
+        return _BAR_LUT[filled]
     
-    def make_sparkline(self, history: deque, max_val: int) -> str:
-        if not history or max_val == 0:
+    def make_sparkline(self, history: array, max_val: int) -> str:
+        count = min(self._hist_pos, 20)
+        if not count or max_val == 0:
             return "─" * 20
         
-        blocks = " ▁▂▃▄▅▆▇█"
-        line = ""
-        samples = list(history)[-20:] if len(history) > 20 else list(history)
-        
-        for val in samples:
-            idx = min(int(val / max_val * 8), 8)
-            line += blocks[idx]
+        # Last `count` samples of the ring, in order, without copying the rest
+        end = self._hist_pos % HISTORY_SIZE
+        start = end - count
+        samples = history[start:end] if start >= 0 else chain(history[start:], history[:end])
         
-        line += "─" * (20 - len(samples))
-        return line
+        # Clamp and look up each sample in C (map) rather than a Python-level loop
+        lut = sparkline_lut(max_val)
+        line = ''.join(map(lut.__getitem__, map(min, samples, repeat(max_val))))
+        return line + "─" * (20 - count)
     
-    def create_dashboard(self) -> Layout:
-        layout = Layout()
-        layout.split_column(
+    def _build_dashboard(self):
+        if self.compact:
+            # One markup panel, re-rendered from _COMPACT_TPL on each refresh
+            self._view = Panel(Text(), title="StackScope", border_style="green", expand=False)
+        else:
+            self._build_layout()
+            self._view = self._layout
+    
+    def _build_layout(self):
+        # Built once; _refresh_layout() mutates the Text cells in place
+        self._layout = Layout()
+        self._layout.split_column(
             Layout(name="header", size=3),
             Layout(name="main", size=18),
             Layout(name="alerts", size=4),
             Layout(name="footer", size=3)
         )
         
-        header_text = Text()
-        header_text.append("StackScope v2.0", style="bold cyan")
-        header_text.append(" │ ", style="dim")
-        header_text.append(f"Port: {self.port or 'N/A'}", style="dim")
-        header_text.append(" │ ", style="dim")
-        header_text.append(f"Packets: {self.packet_count}", style="dim green")
-        
-        if self.packet_count > 0:
-            elapsed = time.time() - self.last_update
-            if elapsed < 2:
-                header_text.append(" │ ", style="dim")
-                header_text.append("● LIVE", style="bold green")
-            else:
-                header_text.append(" │ ", style="dim")
-                header_text.append("○ STALE", style="yellow")
-        
-        layout["header"].update(Panel(Align.center(header_text), border_style="cyan"))
+        self._header_text = Text()
+        self._build_header_prefix()
+        self._layout["header"].update(Panel(Align.center(self._header_text), border_style="cyan"))
         
         main_layout = Layout()
         main_layout.split_row(
@@ -244,123 +467,219 @@ class StackScopeVisualizer:
         bar_table.add_column("Value", width=14)
         bar_table.add_column("Bar", width=25)
         
-        static_pct = (self.static_data / TOTAL_SRAM) * 100
-        bar_table.add_row(
-            "[blue]Static Data[/blue]",
-            f"{self.static_data:4d}B ({static_pct:4.1f}%)",
-            self.make_bar(self.static_data, TOTAL_SRAM, 20, "blue")
+        self._bar_cells: List[List[Text]] = []
+        for label in BAR_ROWS:
+            if label == "Total Used":
+                bar_table.add_row("", "", "")
+            cells = [Text(label), Text(), Text()]
+            bar_table.add_row(*cells)
+            self._bar_cells.append(cells)
+        
+        main_layout["bars"].update(Panel(bar_table, title="Memory Usage", border_style="blue"))
+        
+        self._graph_text = Text()
+        main_layout["graphs"].update(Panel(self._graph_text, title="History", border_style="dim"))
+        
+        self._layout["main"].update(main_layout)
+        
+        self._alert_text = Text()
+        self._memmap_text = Text.assemble(
+            ("Memory Map: ", "dim"),
+            ("[", "dim"),
+            ("STATIC", "blue"),
+            ("|", "dim"),
+            ("HEAP→", "magenta"),
+            ("···FREE···", "green"),
+            ("←STACK", "yellow"),
+            ("]", "dim")
         )
+        self._alert_panel = Panel(Align.center(self._alert_text), title="Status")
+        self._layout["alerts"].update(self._alert_panel)
         
-        stack_pct = (self.stack_usage / TOTAL_SRAM) * 100
-        stack_color = "red" if self.alert_active else "yellow"
-        bar_table.add_row(
-            f"[{stack_color}]Stack Usage[/{stack_color}]",
-            f"{self.stack_usage:4d}B ({stack_pct:4.1f}%)",
-            self.make_bar(self.stack_usage, TOTAL_SRAM, 20, stack_color, True, self.peak_usage)
+        footer_text = Text("Ctrl+C to exit", style="dim")
+        self._layout["footer"].update(Panel(Align.center(footer_text), border_style="dim"))
+    
+    def _build_header_prefix(self):
+        # Static part of the header; the port only changes in connect()
+        self._header_prefix = Text.assemble(
+            ("StackScope v2.0", "bold cyan"),
+            (" │ ", "dim"),
+            (f"Port: {self.port or 'N/A'}", "dim"),
+            (" │ ", "dim")
         )
+    
+    def _set_bar_row(self, row: int, value: int, style: str, bar_style: Optional[str] = None,
+                     show_marker: bool = False):
+        label_cell, value_cell, bar_cell = self._bar_cells[row]
+        value_cell.plain = f"{value:4d}B ({format_pct(value)}%)"
+        bar_cell.plain = self.make_bar(value, TOTAL_SRAM, show_marker, self.peak_usage)
+        # Span rather than Text.style so cell padding stays unstyled
+        label_cell.spans = [Span(0, len(label_cell), style)]
+        bar_cell.spans = [Span(0, len(bar_cell), bar_style or style)]
+    
+    def _clock_state(self) -> Tuple[bool, int]:
+        """Time-driven parts of the view: LIVE/STALE indicator and runtime seconds."""
+        now = self._now
+        is_live = self.packet_count > 0 and (now - self.last_update) < 2
+        return is_live, int(now - self.start_time)
+    
+    def _poll_interval(self) -> float:
+        # Back off while the device is quiet; new data still wakes the loop at once
+        idle = self._now - self.last_update
+        if idle < 1.0:
+            return 0.05
+        if idle < 5.0:
+            return 0.2
+        return 1.0
+    
+    def _row_styles(self) -> Tuple[str, str, str, str]:
+        """Label styles for the stack, peak, heap and free rows."""
+        return ("red" if self.alert_active else "yellow",
+                "bold red" if self.peak_flash else "red",
+                "magenta" if self.heap_usage > 0 else "dim",
+                "red" if self.free_memory < 50 else "green")
+    
+    def _status(self) -> Tuple[str, str, str]:
+        """Status line, its style, and the border style of the panel showing it."""
+        if self.collision_detected:
+            return "⚠ CRITICAL: STACK/HEAP COLLISION DETECTED! ", "bold red on white", "red"
+        if self.alert_active:
+            return "⚠ WARNING: Free memory below 50 bytes! ", "bold yellow", "yellow"
+        if self.peak_flash:
+            return "↑ New peak stack usage recorded ", "cyan", "green"
+        return "✓ Memory status: OK ", "green", "green"
+    
+    def _refresh_dashboard(self):
+        self._shown_clock = self._clock_state()
+        self._dirty = False
+        if self.compact:
+            self._refresh_compact()
+        else:
+            self._refresh_layout()
+    
+    def _refresh_compact(self):
+        is_live, _ = self._shown_clock
+        stack_style, peak_style, heap_style, free_style = self._row_styles()
+        status, status_style, border_style = self._status()
+        used = self.static_data + self.stack_usage + self.heap_usage
         
-        peak_pct = (self.peak_usage / TOTAL_SRAM) * 100
-        peak_style = "bold red" if self.peak_flash else "red"
-        bar_table.add_row(
-            f"[{peak_style}]Peak Stack[/{peak_style}]",
-            f"{self.peak_usage:4d}B ({peak_pct:4.1f}%)",
-            self.make_bar(self.peak_usage, TOTAL_SRAM, 20, "red")
-        )
+        if not self.packet_count:
+            live = ""
+        elif is_live:
+            live = " [dim]│[/] [bold green]● LIVE[/]"
+        else:
+            live = " [dim]│[/] [yellow]○ STALE[/]"
+        
+        self._view.renderable = Text.from_markup(self._COMPACT_TPL.format(
+            port=escape(self.port or 'N/A'), packets=self.packet_count, live=live,
+            static=self.static_data, static_pct=format_pct(self.static_data),
+            static_bar=self.make_bar(self.static_data, TOTAL_SRAM),
+            stack=self.stack_usage, stack_pct=format_pct(self.stack_usage), stack_style=stack_style,
+            stack_bar=self.make_bar(self.stack_usage, TOTAL_SRAM, True, self.peak_usage),
+            peak=self.peak_usage, peak_pct=format_pct(self.peak_usage), peak_style=peak_style,
+            peak_bar=self.make_bar(self.peak_usage, TOTAL_SRAM),
+            heap=self.heap_usage, heap_pct=format_pct(self.heap_usage), heap_style=heap_style,
+            heap_bar=self.make_bar(self.heap_usage, TOTAL_SRAM),
+            free=self.free_memory, free_pct=format_pct(self.free_memory), free_style=free_style,
+            free_bar=self.make_bar(self.free_memory, TOTAL_SRAM),
+            used=used, used_pct=format_pct(used), used_bar=self.make_bar(used, TOTAL_SRAM),
+            stack_spark=self.make_sparkline(self.stack_history, 500),
+            heap_spark=self.make_sparkline(self.heap_history, 500),
+            runtime=self._now - self.start_time,
+            rate=1/(max(0.1, self._now - self.last_update)),
+            status=status, status_style=status_style,
+        ))
+        self._view.border_style = border_style
+    
+    def _refresh_layout(self):
+        is_live, _ = self._shown_clock
         
-        heap_pct = (self.heap_usage / TOTAL_SRAM) * 100
-        heap_color = "magenta" if self.heap_usage > 0 else "dim"
-        bar_table.add_row(
-            f"[{heap_color}]Heap Usage[/{heap_color}]",
-            f"{self.heap_usage:4d}B ({heap_pct:4.1f}%)",
-            self.make_bar(self.heap_usage, TOTAL_SRAM, 20, heap_color)
-        )
+        header_text = self._header_text
+        header_text.plain = ""
+        header_text.append_text(self._header_prefix)
+        header_text.append(f"Packets: {self.packet_count}", style="dim green")
         
-        free_pct = (self.free_memory / TOTAL_SRAM) * 100
-        free_color = "red" if self.free_memory < 50 else "green"
-        bar_table.add_row(
-            f"[{free_color}]Free Memory[/{free_color}]",
-            f"{self.free_memory:4d}B ({free_pct:4.1f}%)",
-            self.make_bar(self.free_memory, TOTAL_SRAM, 20, free_color)
-        )
+        if self.packet_count > 0:
+            header_text.append(" │ ", style="dim")
+            if is_live:
+                header_text.append("● LIVE", style="bold green")
+            else:
+                header_text.append("○ STALE", style="yellow")
         
+        stack_style, peak_style, heap_style, free_style = self._row_styles()
         used = self.static_data + self.stack_usage + self.heap_usage
-        used_pct = (used / TOTAL_SRAM) * 100
-        bar_table.add_row("", "", "")
-        bar_table.add_row(
-            "[white]Total Used[/white]",
-            f"{used:4d}B ({used_pct:4.1f}%)",
-            self.make_bar(used, TOTAL_SRAM, 20, "white")
-        )
         
-        bar_panel = Panel(bar_table, title="Memory Usage", border_style="blue")
-        main_layout["bars"].update(bar_panel)
+        self._set_bar_row(0, self.static_data, "blue")
+        self._set_bar_row(1, self.stack_usage, stack_style, show_marker=True)
+        self._set_bar_row(2, self.peak_usage, peak_style, "red")
+        self._set_bar_row(3, self.heap_usage, heap_style)
+        self._set_bar_row(4, self.free_memory, free_style)
+        self._set_bar_row(5, used, "white")
         
-        graph_text = Text()
+        graph_text = self._graph_text
+        graph_text.plain = ""
         graph_text.append("Stack History:\n", style="yellow")
         graph_text.append(self.make_sparkline(self.stack_history, 500))
         graph_text.append("\n\n")
         graph_text.append("Heap History:\n", style="magenta")
         graph_text.append(self.make_sparkline(self.heap_history, 500))
         graph_text.append("\n\n")
-        graph_text.append(f"Runtime: {time.time() - self.start_time:.0f}s\n", style="dim")
-        graph_text.append(f"Update: {1/(max(0.1, time.time()-self.last_update)):.1f}Hz", style="dim")
-        
-        graph_panel = Panel(graph_text, title="History", border_style="dim")
-        main_layout["graphs"].update(graph_panel)
-        
-        layout["main"].update(main_layout)
-        
-        alert_text = Text()
-        if self.collision_detected:
-            alert_text.append("⚠ CRITICAL: STACK/HEAP COLLISION DETECTED! ", style="bold red on white")
-        elif self.alert_active:
-            alert_text.append("⚠ WARNING: Free memory below 50 bytes! ", style="bold yellow")
-        elif self.peak_flash:
-            alert_text.append("↑ New peak stack usage recorded ", style="cyan")
-        else:
-            alert_text.append("✓ Memory status: OK ", style="green")
+        graph_text.append(f"Runtime: {self._now - self.start_time:.0f}s\n", style="dim")
+        graph_text.append(f"Update: {1/(max(0.1, self._now - self.last_update)):.1f}Hz", style="dim")
         
+        status, status_style, border_style = self._status()
+        alert_text = self._alert_text
+        alert_text.plain = ""
+        alert_text.append(status, style=status_style)
         alert_text.append("\n\n")
-        alert_text.append("Memory Map: ", style="dim")
-        alert_text.append("[", style="dim")
-        alert_text.append("STATIC", style="blue")
-        alert_text.append("|", style="dim")
-        alert_text.append("HEAP→", style="magenta")
-        alert_text.append("···FREE···", style="green")
-        alert_text.append("←STACK", style="yellow")
-        alert_text.append("]", style="dim")
-        
-        alert_color = "red" if self.collision_detected else ("yellow" if self.alert_active else "green")
-        layout["alerts"].update(Panel(Align.center(alert_text), title="Status", border_style=alert_color))
-        
-        footer_text = Text("Ctrl+C to exit", style="dim")
-        layout["footer"].update(Panel(Align.center(footer_text), border_style="dim"))
+        alert_text.append_text(self._memmap_text)
         
-        return layout
+        self._alert_panel.border_style = border_style
+    
+    def create_dashboard(self) -> RenderableType:
+        self._refresh_dashboard()
+        return self._view
     
     def run(self):
         if not self.connect():
             return
         
-        last_handshake = time.time()
+        last_handshake = time.monotonic()
+        last_paint = 0.0
         
         try:
-            with Live(self.create_dashboard(), refresh_per_second=10, screen=True) as live:
+            # No auto-refresh thread: the terminal is repainted only when the view changed
+            with Live(self.create_dashboard(), screen=True, auto_refresh=False) as live:
+                refresh_interval = COMPACT_REFRESH_INTERVAL if self.compact else REFRESH_INTERVAL
                 while True:
-                    while self.read_packet():
-                        pass
+                    self._now = time.monotonic()
+                    # Clear before draining so data arriving mid-render wakes the wait below
+                    self._rx_event.clear()
+                    self.drain_input()
+                    
+                    if self._reader_error is not None or not self._reader.is_alive():
+                        break
                     
-                    if self.packet_count == 0 and (time.time() - last_handshake) > 2.0:
+                    if self.packet_count == 0 and (self._now - last_handshake) > 2.0:
                         self.serial_conn.write(bytes([HANDSHAKE_BYTE]))
-                        last_handshake = time.time()
+                        last_handshake = self._now
                     
-                    live.update(self.create_dashboard())
-                    time.sleep(0.05)
+                    # Only touch the cells when a packet arrived or the clock-driven
+                    # parts (LIVE/STALE, runtime) would change what is shown, and
+                    # never repaint faster than refresh_interval
+                    if ((self._dirty or self._clock_state() != self._shown_clock)
+                            and self._now - last_paint >= refresh_interval):
+                        self._refresh_dashboard()
+                        live.update(self._view, refresh=True)
+                        last_paint = self._now
+                    self._rx_event.wait(self._poll_interval())
                     
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Interrupted by user[/yellow]")
         finally:
             self.disconnect()
+            if self._reader_error is not None:
+                self.console.print(f"[red]Device disconnected: {self._reader_error}[/red]")
             self.console.print(f"[dim]Total packets received: {self.packet_count}[/dim]")
             self.console.print(f"[dim]Peak stack usage: {self.peak_usage} bytes[/dim]")
 
@@ -374,13 +693,16 @@ def main():
                         help=f'Baud rate (default: {DEFAULT_BAUD})')
     parser.add_argument('--static-data', '-s', type=int, default=0,
                         help='Static data usage in bytes (from compiler output)')
+    parser.add_argument('--compact', '-c', action='store_true',
+                        help='Single-panel view repainted at 2 Hz (for SSH or slow terminals)')
     
     args = parser.parse_args()
     
     visualizer = StackScopeVisualizer(
         port=args.port,
         baud=args.baud,
-        static_data=args.static_data
+        static_data=args.static_data,
+        compact=args.compact
     )
     
     visualizer.run()
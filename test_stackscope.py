@@ -0,0 +1,205 @@
+import os
+import struct
+import unittest
+from collections import deque
+from unittest import mock
+
+import stackscope
+from stackscope import PACKET_V1_SIZE, PACKET_V2_SIZE, find_packet
+
+
+def v2_packet(flags, stack, peak, heap, free):
+    return bytes([stackscope.HEADER_BYTE, flags]) + struct.pack('>HHHH', stack, peak, heap, free)
+
+
+def v1_packet(stack):
+    return bytes([stackscope.HEADER_BYTE]) + struct.pack('>H', stack)
+
+
+def reference_sparkline(history, max_val):
+    # The original deque-based implementation
+    if not history or max_val == 0:
+        return "─" * 20
+    blocks = " ▁▂▃▄▅▆▇█"
+    samples = list(history)[-20:]
+    line = "".join(blocks[min(int(val / max_val * 8), 8)] for val in samples)
+    return line + "─" * (20 - len(samples))
+
+
+def reference_bar(value, max_val, width, show_marker=False, marker_pos=0):
+    # The original string-building implementation, without the colour markup
+    pct = 0 if max_val == 0 else min(value / max_val, 1.0)
+    filled = int(pct * width)
+    bar = '█' * filled + '░' * (width - filled)
+    if show_marker and marker_pos > 0:
+        marker_idx = int(min(marker_pos / max_val, 1.0) * width)
+        if marker_idx < width:
+            bar = bar[:marker_idx] + '▌' + bar[marker_idx + 1:]
+    return bar
+
+
+class FindPacketTest(unittest.TestCase):
+    def test_partial_v2_waits_for_more_bytes(self):
+        packet = v2_packet(0x05, 300, 320, 0, 900)
+        for n in range(1, PACKET_V2_SIZE):
+            self.assertEqual(find_packet(bytearray(packet[:n]), 0), (0, 0), n)
+        self.assertEqual(find_packet(bytearray(packet), 0), (0, PACKET_V2_SIZE))
+
+    def test_partial_v2_with_header_byte_in_body_waits(self):
+        # Stack low byte 0xFE sits where the next v1 header would be
+        packet = v2_packet(0x00, 0x01FE, 0x01FE, 0, 900)
+        for n in range(1, PACKET_V2_SIZE):
+            self.assertEqual(find_packet(bytearray(packet[:n]), 0), (0, 0), n)
+
+    def test_v1_stream_is_recognised(self):
+        buf = bytearray(v1_packet(300) + v1_packet(301) + v1_packet(302))
+        self.assertEqual(find_packet(buf, 0), (0, PACKET_V1_SIZE))
+
+    def test_flush_decodes_tail_as_v1(self):
+        buf = bytearray(v1_packet(300))
+        self.assertEqual(find_packet(buf, 0), (0, 0))
+        self.assertEqual(find_packet(buf, 0, flush=True), (0, PACKET_V1_SIZE))
+
+    def test_skips_garbage_before_header(self):
+        buf = bytearray(b'\x00\x13' + v2_packet(0, 1, 2, 3, 4))
+        self.assertEqual(find_packet(buf, 0), (2, PACKET_V2_SIZE))
+
+
+class FormatPctTest(unittest.TestCase):
+    def test_matches_float_formatting(self):
+        for value in range(-3000, 70000):
+            self.assertEqual(stackscope.format_pct(value), f"{value / stackscope.TOTAL_SRAM * 100:4.1f}", value)
+
+
+class SparklineTest(unittest.TestCase):
+    def test_ring_buffer_matches_deque(self):
+        for count in (0, 1, 19, 20, 21, 59, 60, 61, 65, 137):
+            viz = stackscope.StackScopeVisualizer(port='test')
+            stack_ref = deque(maxlen=stackscope.HISTORY_SIZE)
+            heap_ref = deque(maxlen=stackscope.HISTORY_SIZE)
+            for i in range(count):
+                stack, heap = (i * 37) % 700, (i * 53) % 520
+                viz._rx_pending += v2_packet(0, stack, stack, heap, 0)
+                stack_ref.append(stack)
+                heap_ref.append(heap)
+            viz.drain_input()
+            self.assertEqual(viz._hist_pos, count)
+            self.assertEqual(viz.make_sparkline(viz.stack_history, 500),
+                             reference_sparkline(stack_ref, 500), count)
+            self.assertEqual(viz.make_sparkline(viz.heap_history, 500),
+                             reference_sparkline(heap_ref, 500), count)
+
+    def test_zero_scale(self):
+        viz = stackscope.StackScopeVisualizer(port='test')
+        viz._rx_pending += v2_packet(0, 100, 100, 0, 0)
+        viz.drain_input()
+        self.assertEqual(viz.make_sparkline(viz.stack_history, 0), "─" * 20)
+
+
+class MakeBarTest(unittest.TestCase):
+    def setUp(self):
+        self.viz = stackscope.StackScopeVisualizer(port='test')
+
+    def test_matches_reference(self):
+        total = stackscope.TOTAL_SRAM
+        for value in range(0, total + 300, 7):
+            for marker in (0, 1, 50, value, total - 1, total, total + 500):
+                for show_marker in (False, True):
+                    self.assertEqual(self.viz.make_bar(value, total, show_marker, marker),
+                                     reference_bar(value, total, stackscope.BAR_WIDTH, show_marker, marker),
+                                     (value, marker, show_marker))
+
+    def test_marker_at_full_width_is_not_drawn(self):
+        total = stackscope.TOTAL_SRAM
+        # marker index 20 is past the last cell
+        self.assertEqual(self.viz.make_bar(1024, total, True, total), '█' * 10 + '░' * 10)
+        self.assertEqual(self.viz.make_bar(total, total, True, total), '█' * 20)
+        self.assertEqual(self.viz.make_bar(1024, total, True, total - 1), '█' * 10 + '░' * 9 + '▌')
+
+    def test_negative_value_is_an_empty_bar(self):
+        total = stackscope.TOTAL_SRAM
+        for value in (-1, -50, -total, -5 * total):
+            self.assertEqual(self.viz.make_bar(value, total), '░' * 20, value)
+            self.assertEqual(self.viz.make_bar(value, total, True, 512), '░' * 5 + '▌' + '░' * 14, value)
+
+    def test_zero_scale(self):
+        self.assertEqual(self.viz.make_bar(100, 0, True, 50), '░' * 20)
+
+
+class DrainInputTest(unittest.TestCase):
+    def setUp(self):
+        self.viz = stackscope.StackScopeVisualizer(port='test')
+        self.viz._now = 100.0
+
+    def feed(self, data, now=None):
+        if now is not None:
+            self.viz._now = now
+        self.viz._rx_pending += data
+        return self.viz.drain_input()
+
+    def test_v2_fed_one_byte_at_a_time(self):
+        viz = self.viz
+        for _ in range(3):
+            for byte in v2_packet(0x03, 300, 320, 0, 900):
+                self.feed(bytes([byte]))
+        self.assertEqual(viz.packet_count, 3)
+        self.assertEqual((viz.stack_usage, viz.peak_usage, viz.heap_usage, viz.free_memory),
+                         (300, 320, 0, 900))
+        self.assertTrue(viz.alert_active)
+        self.assertTrue(viz.collision_detected)
+
+    def test_partial_packet_carries_over(self):
+        first, second = v2_packet(0x00, 100, 200, 10, 1500), v2_packet(0x04, 110, 210, 12, 1490)
+        for split in range(1, PACKET_V2_SIZE):
+            self.setUp()
+            viz = self.viz
+            self.assertEqual(self.feed(first + second[:split]), 1)
+            self.assertEqual(bytes(viz._rx_buf), second[:split])
+            self.assertEqual(self.feed(second[split:]), 1)
+            self.assertEqual((viz.stack_usage, viz.peak_usage, viz.heap_usage, viz.free_memory, viz.flags),
+                             (110, 210, 12, 1490, 0x04))
+
+    def test_dispatch_does_not_depend_on_chunking(self):
+        v2_stream = b''.join(v2_packet(0x08, 200 + i, 400, 30, 1000 - i) for i in range(6))
+        v1_stream = b''.join(v1_packet(500 + i) for i in range(6))
+        for chunk in range(1, 12):
+            self.setUp()
+            for i in range(0, len(v2_stream), chunk):
+                self.feed(v2_stream[i:i + chunk])
+            self.assertEqual((self.viz.packet_count, self.viz.stack_usage, self.viz.heap_usage,
+                              self.viz.flags), (6, 205, 30, 0x08), chunk)
+
+            self.setUp()
+            for i in range(0, len(v1_stream), chunk):
+                self.feed(v1_stream[i:i + chunk])
+            self.feed(b'', now=101.0)
+            self.assertEqual((self.viz.packet_count, self.viz.stack_usage, self.viz.peak_usage,
+                              self.viz.flags), (6, 505, 505, 0), chunk)
+
+    def test_stalled_tail_is_decoded_as_v1(self):
+        viz = self.viz
+        self.assertEqual(self.feed(v1_packet(300)), 0)
+        self.assertEqual(self.feed(b'', now=100.0 + 2 * stackscope.RX_TAIL_TIMEOUT), 1)
+        self.assertEqual((viz.stack_usage, viz.flags), (300, 0))
+
+
+@unittest.skipUnless(hasattr(os, 'openpty'), "needs a pseudo-terminal")
+class ReaderThreadTest(unittest.TestCase):
+    def test_unplugged_device_reaches_ui(self):
+        master, slave = os.openpty()
+        viz = stackscope.StackScopeVisualizer(port=os.ttyname(slave))
+        with mock.patch('stackscope.time.sleep'):
+            self.assertTrue(viz.connect())
+        self.addCleanup(viz.disconnect)
+        self.assertIsNotNone(viz._fd)
+
+        os.close(master)
+        os.close(slave)
+        self.assertTrue(viz._rx_event.wait(2))
+        viz._reader.join(2)
+        self.assertFalse(viz._reader.is_alive())
+        self.assertIsInstance(viz._reader_error, (stackscope.serial.SerialException, OSError))
+
+
+if __name__ == '__main__':
+    unittest.main()